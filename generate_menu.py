@@ -6,33 +6,171 @@ Generate a professional multi-page PDF menu for East @ West Restaurant
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle, Image, KeepTogether
+from reportlab.platypus import BaseDocTemplate, PageTemplate, Frame, Paragraph, Spacer, PageBreak, Table, TableStyle, Image, KeepTogether, HRFlowable, Flowable, CondPageBreak
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-from reportlab.pdfgen import canvas
-from reportlab.graphics.shapes import Drawing, Circle, Polygon, Path
-from reportlab.graphics import renderPDF
-from PIL import Image as PILImage
+from reportlab.lib.utils import ImageReader
 import os
+import sys
+import functools
+import hashlib
+from copy import copy
+from xml.sax.saxutils import escape
+import json
+from collections import namedtuple
 from io import BytesIO
 
+# Brand colours, parsed once and shared by every style and drawing
+PALETTE = {
+    'green': colors.HexColor('#1a5d3f'),
+    'gold': colors.HexColor('#d4af37'),
+    'mint': colors.HexColor('#f0f9f4'),
+    'gray': colors.HexColor('#4b5563'),
+    'muted': colors.HexColor('#6b7280'),
+    'dark': colors.HexColor('#1f2937'),
+    'off_white': colors.HexColor('#fafafa'),
+    'line': colors.HexColor('#e5e7eb'),
+}
+
+# Menu content lives next to this script so it can be edited without touching code
+MENU_DATA_PATH = os.path.join(os.path.dirname(__file__), 'menu_data.json')
+# Images drawn into the menu
+LOGO_PATH = r'C:\Users\mbike\.claude\projects\menu-project\logo.png'
+VEGAN_ICON_PATH = r'C:\Users\mbike\Downloads\vegan-sigle.jpg'
+VEGETARIAN_ICON_PATH = r'C:\Users\mbike\Downloads\vegetarian-sigle.jpg'
+# Bump to force a rebuild of PDFs whose inputs and code have not changed
+MENU_TEMPLATE_VERSION = '1'
+
+MenuItem = namedtuple('MenuItem', 'name description price is_vegan is_vegetarian', defaults=(False, False))
+MenuSection = namedtuple('MenuSection', 'title info items')
+
+def load_menu(path=MENU_DATA_PATH):
+    """Load the menu sections from JSON"""
+    with open(path, 'rb') as f:
+        data = json.loads(f.read())
+    return tuple(
+        MenuSection(
+            section['title'],
+            section.get('info'),
+            tuple(MenuItem(**item) for item in section['items'])
+        )
+        for section in data['sections']
+    )
+
+MENU = load_menu()
+
+def menu_digest(path=MENU_DATA_PATH, image_paths=(LOGO_PATH, VEGAN_ICON_PATH, VEGETARIAN_ICON_PATH)):
+    """Hash everything the PDF is built from: menu data, this script and its images"""
+    digest = hashlib.blake2b(MENU_TEMPLATE_VERSION.encode())
+    for source_path in (path, __file__):
+        with open(source_path, 'rb') as f:
+            digest.update(f.read())
+    # Images are fingerprinted by mtime + size, like the HTML pipeline does for its input
+    for image_path in image_paths:
+        if os.path.exists(image_path):
+            stat = os.stat(image_path)
+            digest.update(f"{image_path}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+        else:
+            digest.update(f"{image_path}:missing".encode())
+    return digest.hexdigest()
+
+# The menu splits into parts that each start on a fresh page, so they can be built independently
+MENU_PARTS = ('cover', 'sections', 'contact')
+
+# Sections up to this many items are never split across pages
+KEEP_TOGETHER_MAX_ITEMS = 4
+# A longer section only starts on a page with room for its header and this many items
+SECTION_MIN_ITEMS = 1
+
+class CachedImage(Image):
+    """Image flowable drawn from an ImageReader that is already in memory"""
+    def __init__(self, reader, width=None, height=None):
+        # Seeding _img up front stops Image from opening its own ImageReader
+        self._img = reader
+        Image.__init__(self, reader.fp, width=width, height=height)
+
+@functools.lru_cache(maxsize=4)
+def _dietary_image(reader):
+    """Build the 10pt dietary icon flowable for a reader once; callers copy it before use"""
+    return CachedImage(reader, width=10, height=10)
+
+class SectionBar(Flowable):
+    """Section header drawn straight onto the canvas as a coloured bar with centred text"""
+    def __init__(self, title, width=7.2*inch, height=28):
+        Flowable.__init__(self)
+        self.title = title
+        self.width = width
+        self.height = height
+        self.hAlign = 'CENTER'
+        self._title_x = width / 2
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def draw(self):
+        c = self.canv
+        c.setFillColor(PALETTE['green'])
+        c.setStrokeColor(PALETTE['gold'])
+        c.setLineWidth(1)
+        c.rect(0, 0, self.width, self.height, fill=1, stroke=1)
+        c.setFillColor(colors.white)
+        c.setFont('Helvetica-Bold', 12)
+        c.drawCentredString(self._title_x, 13, self.title)
+
 class MenuPDFGenerator:
-    def __init__(self, filename):
-        self.filename = filename
-        self.doc = SimpleDocTemplate(
-            filename,
+    def __init__(self):
+        # Build into memory, render() hands back the finished PDF bytes
+        self.buffer = BytesIO()
+        # One full-page frame inside 0.3 inch margins
+        frame = Frame(
+            0.3*inch,
+            0.3*inch,
+            A4[0] - 0.6*inch,
+            A4[1] - 0.6*inch,
+            id='normal',
+            showBoundary=0
+        )
+        self.frame = frame
+        self.doc = BaseDocTemplate(
+            self.buffer,
             pagesize=A4,
-            rightMargin=0.3*inch,
-            leftMargin=0.3*inch,
-            topMargin=0.3*inch,
-            bottomMargin=0.3*inch
+            pageTemplates=[PageTemplate(id='main', frames=[frame])],
+            # Compressed page streams, and byte-identical output for identical input
+            pageCompression=1,
+            invariant=1
         )
         self.story = []
         self.styles = getSampleStyleSheet()
         self._setup_custom_styles()
         # Use the uploaded icons
-        self.vegan_icon_path = r'C:\Users\mbike\Downloads\vegan-sigle.jpg'
-        self.vegetarian_icon_path = r'C:\Users\mbike\Downloads\vegetarian-sigle.jpg'
+        self.vegan_icon_path = VEGAN_ICON_PATH
+        self.vegetarian_icon_path = VEGETARIAN_ICON_PATH
+        # Decode each image once and share it across every use
+        self._image_readers = {}
+        self._vegan_reader = self._load_icon(self.vegan_icon_path)
+        self._vegetarian_reader = self._load_icon(self.vegetarian_icon_path)
+
+    def _load_image(self, path):
+        """Read an image from disk once, or return None if it is missing"""
+        if path not in self._image_readers:
+            if path and os.path.exists(path):
+                self._image_readers[path] = ImageReader(path)
+            else:
+                self._image_readers[path] = None
+        return self._image_readers[path]
+
+    def _load_icon(self, path, size=(20, 20)):
+        """Downscale a dietary icon once to a tiny PNG, or return None if it is missing"""
+        if not path or not os.path.exists(path):
+            return None
+        # Pillow is only needed when there is an icon to shrink
+        from PIL import Image as PILImage
+        icon = PILImage.open(path).convert('RGB')
+        icon.thumbnail(size, PILImage.LANCZOS)
+        buffer = BytesIO()
+        icon.save(buffer, 'PNG', optimize=True)
+        buffer.seek(0)
+        return ImageReader(buffer)
         
     def _setup_custom_styles(self):
         """Create custom paragraph styles"""
@@ -41,7 +179,7 @@ class MenuPDFGenerator:
             'CustomTitle',
             parent=self.styles['Heading1'],
             fontSize=26,
-            textColor=colors.HexColor('#1a5d3f'),
+            textColor=PALETTE['green'],
             spaceAfter=3,
             alignment=TA_CENTER,
             fontName='Helvetica-Bold'
@@ -52,32 +190,18 @@ class MenuPDFGenerator:
             'CustomSubtitle',
             parent=self.styles['Normal'],
             fontSize=11,
-            textColor=colors.HexColor('#d4af37'),
+            textColor=PALETTE['gold'],
             spaceAfter=4,
             alignment=TA_CENTER,
             fontName='Helvetica-Oblique'
         )
         
-        # Section header style
-        self.section_style = ParagraphStyle(
-            'SectionHeader',
-            parent=self.styles['Heading1'],
-            fontSize=12,
-            textColor=colors.white,
-            spaceAfter=2,
-            spaceBefore=2,
-            fontName='Helvetica-Bold',
-            alignment=TA_CENTER,
-            backColor=colors.HexColor('#1a5d3f'),
-            borderPadding=3
-        )
-        
         # Item name style
         self.item_name_style = ParagraphStyle(
             'ItemName',
             parent=self.styles['Normal'],
             fontSize=8.5,
-            textColor=colors.HexColor('#1a5d3f'),
+            textColor=PALETTE['green'],
             fontName='Helvetica-Bold',
             spaceAfter=0.5
         )
@@ -87,7 +211,7 @@ class MenuPDFGenerator:
             'ItemDesc',
             parent=self.styles['Normal'],
             fontSize=7,
-            textColor=colors.HexColor('#4b5563'),
+            textColor=PALETTE['gray'],
             fontName='Helvetica',
             leading=8
         )
@@ -97,7 +221,7 @@ class MenuPDFGenerator:
             'Price',
             parent=self.styles['Normal'],
             fontSize=9.5,
-            textColor=colors.HexColor('#d4af37'),
+            textColor=PALETTE['gold'],
             fontName='Helvetica-Bold',
             alignment=TA_RIGHT
         )
@@ -107,12 +231,12 @@ class MenuPDFGenerator:
             'InfoBox',
             parent=self.styles['Normal'],
             fontSize=7,
-            textColor=colors.HexColor('#1a5d3f'),
+            textColor=PALETTE['green'],
             fontName='Helvetica-Oblique',
             alignment=TA_CENTER,
             spaceAfter=2,
-            backColor=colors.HexColor('#f0f9f4'),
-            borderColor=colors.HexColor('#1a5d3f'),
+            backColor=PALETTE['mint'],
+            borderColor=PALETTE['green'],
             borderWidth=0.8,
             borderPadding=3
         )
@@ -122,26 +246,37 @@ class MenuPDFGenerator:
             'Footer',
             parent=self.styles['Normal'],
             fontSize=8,
-            textColor=colors.HexColor('#6b7280'),
+            textColor=PALETTE['muted'],
             fontName='Helvetica',
             alignment=TA_CENTER
         )
+
+        # Section items table style - two rows per item (icon | name | price, then description)
+        self.item_table_style = TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('VALIGN', (0, 0), (0, -1), 'MIDDLE'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 2),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 2),
+            ('RIGHTPADDING', (0, 0), (0, -1), 0),
+            ('TOPPADDING', (0, 0), (-1, -1), 1.5),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 1.5),
+            ('BACKGROUND', (0, 0), (-1, -1), PALETTE['off_white']),
+            ('BOX', (0, 0), (-1, -1), 0.2, PALETTE['gold']),
+        ])
     
     def add_cover_page(self, logo_path):
         """Create a very compact cover page with logo"""
         # Add decorative top border
-        top_border = Table([['']], colWidths=[7.2*inch])
-        top_border.setStyle(TableStyle([
-            ('LINEABOVE', (0, 0), (-1, 0), 2, colors.HexColor('#1a5d3f')),
-        ]))
         self.story.append(Spacer(1, 0.08*inch))
-        self.story.append(top_border)
+        self.story.append(HRFlowable(width=7.2*inch, thickness=2, color=PALETTE['green'],
+                                     spaceBefore=0, spaceAfter=16))
 
         self.story.append(Spacer(1, 0.15*inch))
 
         # Add logo - smaller
-        if logo_path and os.path.exists(logo_path):
-            logo = Image(logo_path, width=1.8*inch, height=1.8*inch)
+        logo_reader = self._load_image(logo_path)
+        if logo_reader is not None:
+            logo = CachedImage(logo_reader, width=1.8*inch, height=1.8*inch)
             logo.hAlign = 'CENTER'
             self.story.append(logo)
             self.story.append(Spacer(1, 0.12*inch))
@@ -151,7 +286,7 @@ class MenuPDFGenerator:
             'Description',
             parent=self.styles['Normal'],
             fontSize=11,
-            textColor=colors.HexColor('#1a5d3f'),
+            textColor=PALETTE['green'],
             alignment=TA_CENTER,
             leading=13,
             fontName='Helvetica-Bold'
@@ -160,8 +295,8 @@ class MenuPDFGenerator:
         
         desc_table = Table([[desc]], colWidths=[4.8*inch])
         desc_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#f0f9f4')),
-            ('BOX', (0, 0), (-1, -1), 1.5, colors.HexColor('#d4af37')),
+            ('BACKGROUND', (0, 0), (-1, -1), PALETTE['mint']),
+            ('BOX', (0, 0), (-1, -1), 1.5, PALETTE['gold']),
             ('TOPPADDING', (0, 0), (-1, -1), 5),
             ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
             ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
@@ -176,7 +311,7 @@ class MenuPDFGenerator:
             'Location',
             parent=self.styles['Normal'],
             fontSize=9,
-            textColor=colors.HexColor('#4b5563'),
+            textColor=PALETTE['gray'],
             alignment=TA_CENTER,
             fontName='Helvetica-Oblique'
         )
@@ -186,128 +321,129 @@ class MenuPDFGenerator:
         self.story.append(Spacer(1, 0.15*inch))
         
         # Add decorative bottom border
-        bottom_border = Table([['']], colWidths=[7.2*inch])
-        bottom_border.setStyle(TableStyle([
-            ('LINEBELOW', (0, 0), (-1, 0), 2, colors.HexColor('#1a5d3f')),
-        ]))
-        self.story.append(bottom_border)
+        self.story.append(HRFlowable(width=7.2*inch, thickness=2, color=PALETTE['green'],
+                                     spaceBefore=16, spaceAfter=0))
         
         self.story.append(PageBreak())
     
-    def add_menu_item(self, name, description, price, is_vegan=False, is_vegetarian=False):
-        """Add a single menu item with very compact styling"""
+    def _menu_item_rows(self, name, description, price, is_vegan=False, is_vegetarian=False):
+        """Build the two table rows for a single menu item, returns (rows, has_icon)"""
+        # Menu text is plain text, so escape it before it goes into paragraph markup
+        name_content = Paragraph(f"<b>{escape(name)}</b>", self.item_name_style)
+        price_content = Paragraph(f"<b>{escape(price)}</b>", self.price_style)
+        desc_content = Paragraph(escape(description), self.item_desc_style)
+
         # Create dietary indicator with uploaded icons - very small
-        if is_vegan and self.vegan_icon_path and os.path.exists(self.vegan_icon_path):
-            dietary_img = Image(self.vegan_icon_path, width=10, height=10)
-            dietary_content = Table(
-                [[dietary_img, Paragraph(f"<b>{name}</b>", self.item_name_style)]],
-                colWidths=[12, 5.9*inch]
-            )
-            dietary_content.setStyle(TableStyle([
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('LEFTPADDING', (0, 0), (-1, -1), 0),
-                ('RIGHTPADDING', (0, 0), (0, 0), 2),
-                ('TOPPADDING', (0, 0), (-1, -1), 0),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-            ]))
-        elif is_vegetarian and self.vegetarian_icon_path and os.path.exists(self.vegetarian_icon_path):
-            dietary_img = Image(self.vegetarian_icon_path, width=10, height=10)
-            dietary_content = Table(
-                [[dietary_img, Paragraph(f"<b>{name}</b>", self.item_name_style)]],
-                colWidths=[12, 5.9*inch]
-            )
-            dietary_content.setStyle(TableStyle([
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('LEFTPADDING', (0, 0), (-1, -1), 0),
-                ('RIGHTPADDING', (0, 0), (0, 0), 2),
-                ('TOPPADDING', (0, 0), (-1, -1), 0),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-            ]))
+        if is_vegan and self._vegan_reader is not None:
+            dietary_reader = self._vegan_reader
+        elif is_vegetarian and self._vegetarian_reader is not None:
+            dietary_reader = self._vegetarian_reader
         else:
-            dietary_content = Paragraph(f"<b>{name}</b>", self.item_name_style)
-        
-        # Create the item content
-        item_data = [
-            [dietary_content, Paragraph(f"<b>{price}</b>", self.price_style)],
-            [Paragraph(description, self.item_desc_style), ""]
-        ]
-        
-        item_table = Table(item_data, colWidths=[5.9*inch, 1.3*inch])
-        item_table.setStyle(TableStyle([
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 2),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 2),
-            ('TOPPADDING', (0, 0), (-1, -1), 1.5),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 1.5),
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#fafafa')),
-            ('BOX', (0, 0), (-1, -1), 0.2, colors.HexColor('#d4af37')),
-            ('LINEBELOW', (0, 0), (-1, 0), 0.3, colors.HexColor('#e5e7eb')),
-        ]))
-        
-        self.story.append(item_table)
-        self.story.append(Spacer(1, 0.01*inch))
+            dietary_reader = None
+
+        # The description row always spans the icon column, so descriptions line up
+        desc_row = [desc_content, "", ""]
+        if dietary_reader is not None:
+            # Flowables carry layout state, so every row gets its own shallow copy
+            dietary_img = copy(_dietary_image(dietary_reader))
+            return [[dietary_img, name_content, price_content], desc_row], True
+        return [[name_content, "", price_content], desc_row], False
     
-    def add_section(self, title, items):
+    def add_section(self, title, items, info=None):
         """Add a menu section with very compact styling"""
+        # The info box belongs to the section, so it moves to a new page with it
+        section = self._info_box_flowables(info) if info else []
+
         # Add decorative top border
-        top_border = Table([['']], colWidths=[7.2*inch])
-        top_border.setStyle(TableStyle([
-            ('LINEABOVE', (0, 0), (-1, 0), 1, colors.HexColor('#d4af37')),
-        ]))
-        self.story.append(top_border)
+        section.append(HRFlowable(width=7.2*inch, thickness=1, color=PALETTE['gold'],
+                                  spaceBefore=0, spaceAfter=17))
         
         # Section header with background
-        header_table = Table([[Paragraph(title.upper(), self.section_style)]], colWidths=[7.2*inch])
-        header_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#1a5d3f')),
-            ('BOX', (0, 0), (-1, -1), 1, colors.HexColor('#d4af37')),
-            ('TOPPADDING', (0, 0), (-1, -1), 3),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
-            ('LEFTPADDING', (0, 0), (-1, -1), 5),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 5),
-        ]))
-        self.story.append(header_table)
+        section.append(SectionBar(title.upper()))
         
         # Add decorative bottom border
-        bottom_border = Table([['']], colWidths=[7.2*inch])
-        bottom_border.setStyle(TableStyle([
-            ('LINEBELOW', (0, 0), (-1, 0), 1, colors.HexColor('#d4af37')),
-        ]))
-        self.story.append(bottom_border)
-        self.story.append(Spacer(1, 0.02*inch))
-        
-        # Add items
-        for item in items:
-            self.add_menu_item(
-                item['name'],
-                item['description'],
-                item['price'],
-                item.get('is_vegan', False),
-                item.get('is_vegetarian', False)
+        section.append(HRFlowable(width=7.2*inch, thickness=1, color=PALETTE['gold'],
+                                  spaceBefore=17, spaceAfter=0))
+        section.append(Spacer(1, 0.02*inch))
+        
+        # Add items - all rows go into one table so the section is laid out in one pass
+        header = list(section)
+        items_table = None
+        item_data = []
+        item_commands = []
+        for item_index, item in enumerate(items):
+            rows, has_icon = self._menu_item_rows(
+                item.name,
+                item.description,
+                item.price,
+                item.is_vegan,
+                item.is_vegetarian
             )
+            name_row = 2 * item_index
+            desc_row = name_row + 1
+            item_data.extend(rows)
+            if not has_icon:
+                # Let the name run into the empty icon column
+                item_commands.append(('SPAN', (0, name_row), (1, name_row)))
+            item_commands.extend([
+                ('SPAN', (0, desc_row), (1, desc_row)),
+                # Never split an item's name from its description across pages
+                ('NOSPLIT', (0, name_row), (-1, desc_row)),
+                ('LINEBELOW', (0, name_row), (-1, name_row), 0.3, PALETTE['line']),
+            ])
+            if item_index < len(items) - 1:
+                item_commands.append(('LINEBELOW', (0, desc_row), (-1, desc_row), 0.2, PALETTE['gold']))
+
+        if item_data:
+            items_table = Table(item_data, colWidths=[12, 5.9*inch - 12, 1.3*inch])
+            items_table.setStyle(self.item_table_style)
+            items_table.setStyle(TableStyle(item_commands))
+            section.append(items_table)
+
+        # Small sections move to the next page as a whole; long ones only need room
+        # for the info box, header and first item so that group is never orphaned
+        if len(items) <= KEEP_TOGETHER_MAX_ITEMS:
+            self.story.append(KeepTogether(section))
+        else:
+            self.story.append(CondPageBreak(self._section_start_height(header, items_table)))
+            self.story.extend(section)
         
         self.story.append(Spacer(1, 0.03*inch))
     
-    def add_info_box(self, text):
-        """Add a very compact information box"""
-        info_content = Paragraph(f"<i>✦ {text} ✦</i>", self.info_style)
+    def _section_start_height(self, header, items_table):
+        """Height of a section's header flowables plus its first SECTION_MIN_ITEMS items"""
+        width = self.frame._getAvailableWidth()
+        height = 0
+        for flowable in header:
+            _, flowable_height = flowable.wrap(width, self.frame._height)
+            height += flowable.getSpaceBefore() + flowable_height + flowable.getSpaceAfter()
+        if items_table is not None:
+            # Two table rows per item: name and description
+            items_table.wrap(width, self.frame._height)
+            height += sum(items_table._rowHeights[:2 * SECTION_MIN_ITEMS])
+        return height
+
+    def _info_box_flowables(self, text):
+        """Build the flowables for a very compact information box"""
+        info_content = Paragraph(f"<i>✦ {escape(text)} ✦</i>", self.info_style)
         
         # Create a table for the info box with border
         info_table = Table([[info_content]], colWidths=[7.2*inch])
         info_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#f0f9f4')),
-            ('BOX', (0, 0), (-1, -1), 0.8, colors.HexColor('#1a5d3f')),
+            ('BACKGROUND', (0, 0), (-1, -1), PALETTE['mint']),
+            ('BOX', (0, 0), (-1, -1), 0.8, PALETTE['green']),
             ('TOPPADDING', (0, 0), (-1, -1), 3),
             ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
             ('LEFTPADDING', (0, 0), (-1, -1), 6),
             ('RIGHTPADDING', (0, 0), (-1, -1), 6),
         ]))
-        self.story.append(info_table)
-        self.story.append(Spacer(1, 0.03*inch))
+        return [info_table, Spacer(1, 0.03*inch)]
     
     def add_contact_page(self, logo_path):
         """Add a compact contact information page with logo footer"""
-        self.story.append(PageBreak())
+        # A page break at the very start of a document would leave a blank page
+        if self.story:
+            self.story.append(PageBreak())
         
         self.story.append(Spacer(1, 0.3*inch))
         
@@ -325,8 +461,8 @@ class MenuPDFGenerator:
         contact_title = Paragraph("Visit Us", contact_title_style)
         title_table = Table([[contact_title]], colWidths=[7.2*inch])
         title_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#1a5d3f')),
-            ('BOX', (0, 0), (-1, -1), 2, colors.HexColor('#d4af37')),
+            ('BACKGROUND', (0, 0), (-1, -1), PALETTE['green']),
+            ('BOX', (0, 0), (-1, -1), 2, PALETTE['gold']),
             ('TOPPADDING', (0, 0), (-1, -1), 10),
             ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
         ]))
@@ -339,7 +475,7 @@ class MenuPDFGenerator:
             'ContactDetails',
             parent=self.styles['Normal'],
             fontSize=10,
-            textColor=colors.HexColor('#1f2937'),
+            textColor=PALETTE['dark'],
             alignment=TA_CENTER,
             leading=14,
             fontName='Helvetica'
@@ -358,8 +494,8 @@ class MenuPDFGenerator:
         
         contact_table = Table([[contact]], colWidths=[6.2*inch])
         contact_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#f0f9f4')),
-            ('BOX', (0, 0), (-1, -1), 1.5, colors.HexColor('#1a5d3f')),
+            ('BACKGROUND', (0, 0), (-1, -1), PALETTE['mint']),
+            ('BOX', (0, 0), (-1, -1), 1.5, PALETTE['green']),
             ('TOPPADDING', (0, 0), (-1, -1), 12),
             ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
             ('LEFTPADDING', (0, 0), (-1, -1), 10),
@@ -383,8 +519,8 @@ class MenuPDFGenerator:
         
         button_table = Table([[button]], colWidths=[2.5*inch])
         button_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#d4af37')),
-            ('BOX', (0, 0), (-1, -1), 1.5, colors.HexColor('#1a5d3f')),
+            ('BACKGROUND', (0, 0), (-1, -1), PALETTE['gold']),
+            ('BOX', (0, 0), (-1, -1), 1.5, PALETTE['green']),
             ('TOPPADDING', (0, 0), (-1, -1), 6),
             ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
             ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
@@ -399,7 +535,7 @@ class MenuPDFGenerator:
             'FooterMsg',
             parent=self.styles['Normal'],
             fontSize=9,
-            textColor=colors.HexColor('#4b5563'),
+            textColor=PALETTE['gray'],
             alignment=TA_CENTER,
             fontName='Helvetica-Oblique'
         )
@@ -409,148 +545,61 @@ class MenuPDFGenerator:
         # Add logo in footer
         self.story.append(Spacer(1, 0.2*inch))
 
-        if logo_path and os.path.exists(logo_path):
-            footer_logo = Image(logo_path, width=0.9*inch, height=0.9*inch)
+        logo_reader = self._load_image(logo_path)
+        if logo_reader is not None:
+            footer_logo = CachedImage(logo_reader, width=0.9*inch, height=0.9*inch)
             footer_logo.hAlign = 'CENTER'
             self.story.append(footer_logo)
         
-    def build(self):
-        """Build the PDF document"""
+    def add_sections(self, sections):
+        """Add every menu section, with its info box when it has one"""
+        for section in sections:
+            self.add_section(section.title, section.items, section.info)
+        
+    def render(self):
+        """Build the PDF document and return its bytes"""
         self.doc.build(self.story)
+        return self.buffer.getvalue()
 
-def main():
-    # Initialize the PDF generator
-    pdf = MenuPDFGenerator("east_west_menu.pdf")
-
-    # Use the restaurant logo
-    logo_path = r'C:\Users\mbike\.claude\projects\menu-project\logo.png'
-    
-    # Add cover page with logo
-    pdf.add_cover_page(logo_path)
-    
-    # PAGE 1: COLD MEZZES
-    cold_mezzes = [
-        {"name": "Zahra", "description": "Cooked cauliflower, marinated in a homemade sauce (tomato, garlic and lemon), topped with lemon tahini sauce", "price": "7,50€", "is_vegetarian": True},
-        {"name": "Muhammara", "description": "Grilled red pepper dip, pomegranate molasses and walnuts", "price": "8€", "is_vegan": True},
-        {"name": "Makdous", "description": "Baby eggplants stuffed with walnuts and peppers marinated in olive oil", "price": "8€", "is_vegan": True},
-        {"name": "Itch", "description": "Bulgur cooked in tomato sauce with peppers, onion, parsley and pomegranate molasses", "price": "7,50€", "is_vegan": True},
-        {"name": "Hummus", "description": "Chickpea puree with tahini (sesame paste)", "price": "7,50€", "is_vegan": True},
-        {"name": "Moutabal", "description": "Grilled eggplant caviar with tahini (sesame paste)", "price": "8€", "is_vegan": True},
-        {"name": "Warak Enab", "description": "Vine leaves stuffed with rice, herbs, marinated in olive oil, mint and pomegranate molasses", "price": "7€", "is_vegan": True},
-        {"name": "Moussaka", "description": "Eggplant, onion, chickpeas and tomato", "price": "7,50€", "is_vegan": True}
-    ]
-    
-    pdf.add_section("Cold Mezzes", cold_mezzes)
-    
-    # WARM MEZZES
-    warm_mezzes = [
-        {"name": "Oriental Eggplant", "description": "Grilled eggplant topped with minced meat cooked with onion, tomato and pepper", "price": "13,50€"},
-        {"name": "Chicken Liver", "description": "Chicken liver cooked with onion and special spices. Served with pomegranate sauce", "price": "11,50€"},
-        {"name": "Fatteh", "description": "Cooked chickpeas, fried Lebanese bread, garlic and homemade lemon tahini sauce", "price": "7,50€", "is_vegetarian": True},
-        {"name": "Falafel (2 pcs)", "description": "Fried chickpea balls served with tahini sauce", "price": "4€", "is_vegan": True},
-        {"name": "Grilled Syrian Cheese", "description": "Grilled Syrian cheese", "price": "10€", "is_vegetarian": True},
-        {"name": "Kibbeh (2 pcs)", "description": "Fried bulgur croquettes stuffed with minced meat, onion and walnuts", "price": "7€"},
-        {"name": "Sujuk", "description": "Oven-baked Lebanese bread stuffed with seasoned minced meat, tomato and pickles", "price": "12,50€"},
-        {"name": "Arayes Cheese", "description": "Oven-baked Lebanese bread stuffed with Syrian cheese", "price": "10€", "is_vegetarian": True},
-        {"name": "Toshka", "description": "Oven-baked Lebanese bread stuffed with minced meat and Syrian cheese", "price": "12,50€"},
-        {"name": "Batata Harra", "description": "Fried potato cubes with red peppers, coriander and garlic", "price": "7,50€", "is_vegan": True},
-        {"name": "Foul Moudamas", "description": "Fava beans marinated with lemon juice, tomatoes, cumin, garlic, olive oil and tahini sauce", "price": "8€", "is_vegan": True}
-    ]
-    
-    pdf.add_section("Warm Mezzes", warm_mezzes)
-    
-    # TASTING MENUS - on same page
-    pdf.add_info_box("All tasting menus serve 2 people")
-    
-    tasting_menus = [
-        {"name": "Menu East@West", "description": "Fattoush, Hummus, Moutabal, Zahra, Falafel, 2× Kibbeh, 2× Kabab skewers, 2× Chich taouk, 2× Dessert", "price": "67,50€"},
-        {"name": "Menu Vegan", "description": "Fattoush, Hummus, Moutabal, Moussaka, Itch, Zahra, 2× Falafel, Batata Harra, 2× Dessert", "price": "64,50€", "is_vegan": True},
-        {"name": "Menu Sahten", "description": "Tabouleh, Hummus, Toshka, Sujuk, Chicken liver, 2× Kibbeh, 2× Skewers, 2× Dessert", "price": "84€"},
-        {"name": "Menu Lazeez", "description": "Tabouleh, Hummus, Moutabal, Muhammara, Warak Enab, Moussaka, Foul Moudamas, 2× Falafel, 2× Dessert", "price": "65,50€", "is_vegan": True}
-    ]
-    
-    pdf.add_section("Tasting Menus / 2 People", tasting_menus)
-    
-    # DISHES
-    dishes = [
-        {"name": "Foodie Meat", "description": "Hummus, Zahra, Kibbeh, 1× Chich taouk, 1× Kabab, Foul moudamas, Fattouch", "price": "24€"},
-        {"name": "Foodie Vegan", "description": "Hummus, Zahra, 2× Warak eneb, 2× Falafel, Batata harra, Foul moudamas, Fattouch", "price": "24€", "is_vegan": True},
-        {"name": "Chef's Mezze", "description": "Grilled minced meat with mushrooms, onion, lemon tahini sauce and parsley", "price": "13,50€"}
-    ]
-    
-    pdf.add_section("Dishes", dishes)
-    
-    # SKEWERS
-    pdf.add_info_box("All skewers served with garlic sauce and pickles")
-    
-    skewers = [
-        {"name": "2× Shish Taouk", "description": "Chicken skewers", "price": "10€"},
-        {"name": "2× Kebab", "description": "Beef skewers", "price": "10€"}
-    ]
-    
-    pdf.add_section("Skewers", skewers)
-    
-    # LUNCH DISHES - removed page break
-    pdf.add_info_box("All dishes are served with Lebanese bread")
-    
-    lunch_dishes = [
-        {"name": "Chef's Dish", "description": "1 kebab, 1 chich taouk, warak eneb, kibbeh, cauliflower, muhammara, fattouch", "price": "23,50€"},
-        {"name": "Sujuk", "description": "Lebanese bread stuffed with minced meat, tomato, pickles + hummus, moutabal, Fattoush", "price": "20,80€"},
-        {"name": "Toshka", "description": "Lebanese bread stuffed with minced meat and Syrian cheese + hummus, moutabal, Fattoush", "price": "20,80€"},
-        {"name": "Chich Taouk", "description": "2 chicken skewers + hummus, itch (bulgur), fattoush, pickles, garlic sauce", "price": "19€"},
-        {"name": "Mix Grill", "description": "1 kebab and 1 chich taouk + hummus, itch (bulgur), fattoush", "price": "19€"},
-        {"name": "Kebab", "description": "2 seasoned minced meat skewers + hummus, fattoush", "price": "19€"},
-        {"name": "Mix Break", "description": "Hummus, itch (bulgur), kabab/chich taouk, cauliflower, fattouch", "price": "16,50€"},
-        {"name": "Falafel", "description": "4 pieces falafel + hummus, moutabal, Fattoush, tahini sauce, pickles", "price": "18€", "is_vegan": True},
-        {"name": "Mix Break Vegan", "description": "Hummus, warak eneb, itch (bulgur), cauliflower, fattouch", "price": "14,50€", "is_vegan": True}
-    ]
-    
-    pdf.add_section("Lunch Dishes", lunch_dishes)
-    
-    # SANDWICH FORMULAS
-    sandwiches = [
-        {"name": "Falafel Sandwich + Fattoush Salad", "description": "Falafel, tomato, tahini, pickles, lettuce", "price": "12,50€", "is_vegan": True},
-        {"name": "Chich Taouk + Fattoush Salad", "description": "Grilled chicken, lettuce, tomato, garlic sauce", "price": "12,50€"},
-        {"name": "Kabab + Fattoush Salad", "description": "Minced meat, hummus, tomato, lettuce, onion", "price": "12,50€"}
-    ]
-    
-    pdf.add_section("Sandwich + Salad Formulas", sandwiches)
-    
-    # SALADS - removed page break
-    salads = [
-        {"name": "Original Tabouleh", "description": "Parsley, tomato, onion, lemon, bulgur, mint", "price": "8€", "is_vegan": True},
-        {"name": "Fattoush", "description": "Tomato, lettuce, red cabbage, radish, cucumber, onion", "price": "8€", "is_vegan": True},
-        {"name": "Falafel Salad", "description": "Falafel, lettuce, cucumber, tomato, pickles, tahini", "price": "13,50€", "is_vegan": True}
-    ]
-    
-    pdf.add_section("Salads", salads)
+def build_menu_pdf(parts, logo_path):
+    """Build the given menu parts into one PDF and return its bytes"""
+    pdf = MenuPDFGenerator()
+    for part in parts:
+        if part == 'cover':
+            # Add cover page with logo
+            pdf.add_cover_page(logo_path)
+        elif part == 'sections':
+            pdf.add_sections(MENU)
+        elif part == 'contact':
+            # Add contact page with logo in footer
+            pdf.add_contact_page(logo_path)
+        else:
+            raise ValueError(f"Unknown menu part: {part}")
+    return pdf.render()
 
-    # DESSERTS
-    desserts = [
-        {"name": "Aish el Saraya (Vgn)", "description": "A layer of sweetened biscuit, a layer of vegan pudding, orange blossom water and pistachio", "price": "3,50€", "is_vegan": True},
-        {"name": "Halve (Vegan)", "description": "Sesame paste and pistachio", "price": "3,50€", "is_vegan": True},
-        {"name": "Baklava", "description": "Traditional Lebanese pastry", "price": "6€"},
-        {"name": "Homemade Traditional Ice Cream", "description": "Frozen dairy ice cream dressed with pistachio", "price": "9€"}
-    ]
+def main(force=False):
+    output_pdf = "east_west_menu.pdf"
+    digest_path = output_pdf + ".hash"
 
-    pdf.add_section("Desserts", desserts)
+    # Skip the build entirely when the menu has not changed since the last one
+    digest = menu_digest()
+    if not force and os.path.exists(output_pdf) and os.path.exists(digest_path):
+        with open(digest_path) as f:
+            if f.read().strip() == digest:
+                print(f"{output_pdf} is up to date")
+                return
 
-    # EXTRAS
-    extras = [
-        {"name": "4× Extra Bread Pieces", "description": "Additional Lebanese bread pieces", "price": "1€", "is_vegan": True},
-        {"name": "Extra Garlic Sauce", "description": "Homemade garlic sauce", "price": "2€", "is_vegetarian": True},
-        {"name": "Extra Spicy Pepper Sauce", "description": "Homemade spicy pepper sauce", "price": "2€", "is_vegan": True}
-    ]
+    # Use the restaurant logo
+    logo_path = LOGO_PATH
 
-    pdf.add_section("Extras", extras)
+    pdf_bytes = build_menu_pdf(MENU_PARTS, logo_path)
 
-    # Add contact page with logo in footer
-    pdf.add_contact_page(logo_path)
-    
-    # Build the PDF
-    pdf.build()
+    with open(output_pdf, 'wb') as f:
+        f.write(pdf_bytes)
+    with open(digest_path, 'w') as f:
+        f.write(digest)
     print("PDF menu generated successfully!")
-    print(f"Saved to: east_west_menu.pdf")
+    print(f"Saved to: {output_pdf}")
 
 if __name__ == "__main__":
-    main()
+    main(force='--force' in sys.argv[1:])
@@ -4,89 +4,142 @@ Generate a professional PDF menu from the HTML menu editor
 """
 
 import os
+import re
 import sys
-
-try:
-    from weasyprint import HTML, CSS
-except ImportError:
-    print("Installing weasyprint...")
-    os.system("pip install weasyprint")
-    from weasyprint import HTML, CSS
-
-def generate_pdf():
+import hashlib
+
+# Directory holding the menu HTML and the generated PDF
+_BASE_DIR = os.path.dirname(__file__)
+
+# Additional CSS for PDF optimization
+_PDF_CSS_SOURCE = '''
+    @page {
+        size: A4;
+        margin: 0.5cm;
+    }
+
+    body {
+        background: white !important;
+    }
+
+    .actions {
+        display: none !important;
+    }
+
+    .menu-item input,
+    .menu-item textarea {
+        border: none !important;
+        background: transparent !important;
+        padding: 0 !important;
+        pointer-events: none;
+    }
+
+    .item-name input {
+        font-size: 16px !important;
+        font-weight: bold !important;
+        color: #1a5d3f !important;
+    }
+
+    .item-description textarea {
+        font-size: 14px !important;
+        color: #4b5563 !important;
+        height: auto !important;
+    }
+
+    .item-price input {
+        font-size: 18px !important;
+        font-weight: bold !important;
+        color: #d4af37 !important;
+        text-align: right !important;
+    }
+
+    /* Page breaks */
+    .section {
+        page-break-inside: avoid;
+    }
+
+    .menu-item {
+        page-break-inside: avoid;
+    }
+'''
+
+# Local files the HTML pulls in through src="..." attributes (images)
+_SRC_RE = re.compile(r'src="([^"]+)"')
+
+# weasyprint is slow to import, so it is loaded on first use and cached here
+_HTML = None
+_PDF_CSS = None
+
+def _load_weasyprint():
+    """Import weasyprint and parse the PDF stylesheet, only once per process"""
+    global _HTML, _PDF_CSS
+    if _HTML is None:
+        from weasyprint import HTML, CSS
+        _PDF_CSS = CSS(string=_PDF_CSS_SOURCE)
+        _HTML = HTML
+    return _HTML, _PDF_CSS
+
+def _html_digest(html_file):
+    """Fingerprint the HTML file and the images it references (mtime + size),
+    together with this script and its PDF stylesheet"""
+    with open(__file__, 'rb') as f:
+        digest = hashlib.blake2b(f.read())
+    html_dir = os.path.dirname(html_file)
+    with open(html_file, encoding='utf-8') as f:
+        sources = sorted(set(_SRC_RE.findall(f.read())))
+    for path in [html_file] + [os.path.join(html_dir, src) for src in sources
+                               if not src.startswith(('http:', 'https:', 'data:'))]:
+        if os.path.exists(path):
+            stat = os.stat(path)
+            digest.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+        else:
+            digest.update(f"{path}:missing".encode())
+    return digest.hexdigest()
+
+def generate_pdf(force=False):
     """Generate PDF from the HTML menu"""
 
     # Path to the HTML file
-    html_file = os.path.join(os.path.dirname(__file__), 'menu_editor.html')
+    html_file = os.path.join(_BASE_DIR, 'menu_editor.html')
 
     # Path to the output PDF
-    output_pdf = os.path.join(os.path.dirname(__file__), 'east_west_menu_final.pdf')
+    output_pdf = os.path.join(_BASE_DIR, 'east_west_menu_final.pdf')
 
     if not os.path.exists(html_file):
         print(f"Error: HTML file not found at {html_file}")
         return False
 
+    # Skip weasyprint entirely when the HTML has not changed since the last build
+    digest_path = output_pdf + '.hash'
+    digest = _html_digest(html_file)
+    if not force and os.path.exists(output_pdf) and os.path.exists(digest_path):
+        with open(digest_path) as f:
+            if f.read().strip() == digest:
+                print(f"✓ {output_pdf} is up to date")
+                return True
+
+    try:
+        HTML, pdf_css = _load_weasyprint()
+    except ImportError:
+        print("Error: weasyprint is not installed. Install it with: pip install weasyprint")
+        return False
+    except OSError as e:
+        # weasyprint is installed but its system libraries (pango, cairo) are missing
+        print(f"Error: weasyprint is installed but could not load pango/cairo: {e}")
+        return False
+
     print(f"Reading HTML from: {html_file}")
     print(f"Generating PDF...")
 
     try:
-        # Additional CSS for PDF optimization
-        pdf_css = CSS(string='''
-            @page {
-                size: A4;
-                margin: 0.5cm;
-            }
-
-            body {
-                background: white !important;
-            }
-
-            .actions {
-                display: none !important;
-            }
-
-            .menu-item input,
-            .menu-item textarea {
-                border: none !important;
-                background: transparent !important;
-                padding: 0 !important;
-                pointer-events: none;
-            }
-
-            .item-name input {
-                font-size: 16px !important;
-                font-weight: bold !important;
-                color: #1a5d3f !important;
-            }
-
-            .item-description textarea {
-                font-size: 14px !important;
-                color: #4b5563 !important;
-                height: auto !important;
-            }
-
-            .item-price input {
-                font-size: 18px !important;
-                font-weight: bold !important;
-                color: #d4af37 !important;
-                text-align: right !important;
-            }
-
-            /* Page breaks */
-            .section {
-                page-break-inside: avoid;
-            }
-
-            .menu-item {
-                page-break-inside: avoid;
-            }
-        ''')
-
-        # Generate PDF
-        HTML(filename=html_file).write_pdf(
-            output_pdf,
-            stylesheets=[pdf_css]
+        # Generate PDF - lay out the document first, then write it out
+        document = HTML(filename=html_file).render(
+            stylesheets=[pdf_css],
+            presentational_hints=False
         )
+        document.write_pdf(output_pdf)
+        with open(digest_path, 'w') as f:
+            f.write(digest)
 
         print(f"✓ PDF generated successfully!")
         print(f"✓ Saved to: {output_pdf}")
@@ -97,5 +150,5 @@ def generate_pdf():
         return False
 
 if __name__ == "__main__":
-    success = generate_pdf()
+    success = generate_pdf(force='--force' in sys.argv[1:])
     sys.exit(0 if success else 1)